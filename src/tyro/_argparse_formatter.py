@@ -23,6 +23,7 @@ import sys
 from gettext import gettext as _
 from typing import (
     Any,
+    Callable,
     Dict,
     Generator,
     Iterable,
@@ -205,45 +206,67 @@ def monkeypatch_len(obj: Any) -> int:
         return len(obj)
 
 
+_terminal_width: Optional[int] = None
+
+
+@contextlib.contextmanager
+def _terminal_width_context() -> Generator[None, None, None]:
+    """Context for reading the terminal width once. Used by `ansi_context()`."""
+    global _terminal_width
+    if _terminal_width is not None:
+        # No-op when the context manager is nested.
+        yield
+        return
+
+    _terminal_width = shutil.get_terminal_size().columns - 2
+    try:
+        yield
+    finally:
+        _terminal_width = None
+
+
 @contextlib.contextmanager
 def ansi_context() -> Generator[None, None, None]:
     """Context for working with ANSI codes + argparse:
     - Applies a temporary monkey patch for making argparse ignore ANSI codes when
       wrapping usage text.
     - Enables support for Windows via colorama.
+    - Reads the terminal width once, instead of for every formatter that argparse
+      constructs.
     """
 
-    if not hasattr(argparse, "len"):
-        # Sketchy, but seems to work.
-        argparse.len = monkeypatch_len  # type: ignore
-        try:  # pragma: no cover
-            # Use Colorama to support coloring in Windows shells.
-            import colorama  # type: ignore
-
-            # Notes:
-            #
-            # (1) This context manager looks very nice and local, but under-the-hood
-            # does some global operations which look likely to cause unexpected
-            # behavior if another library relies on `colorama.init()` and
-            # `colorama.deinit()`.
-            #
-            # (2) SSHed into a non-Windows machine from a WinAPI terminal => this
-            # won't work.
-            #
-            # Fixing these issues doesn't seem worth it: it doesn't seem like there
-            # are low-effort solutions for either problem, and more modern terminals
-            # in Windows (PowerShell, MSYS2, ...) do support ANSI codes anyways.
-            with colorama.colorama_text():
+    with _terminal_width_context():
+        if not hasattr(argparse, "len"):
+            # Sketchy, but seems to work.
+            argparse.len = monkeypatch_len  # type: ignore
+            try:  # pragma: no cover
+                # Use Colorama to support coloring in Windows shells.
+                import colorama  # type: ignore
+
+                # Notes:
+                #
+                # (1) This context manager looks very nice and local, but under-the-hood
+                # does some global operations which look likely to cause unexpected
+                # behavior if another library relies on `colorama.init()` and
+                # `colorama.deinit()`.
+                #
+                # (2) SSHed into a non-Windows machine from a WinAPI terminal => this
+                # won't work.
+                #
+                # Fixing these issues doesn't seem worth it: it doesn't seem like there
+                # are low-effort solutions for either problem, and more modern terminals
+                # in Windows (PowerShell, MSYS2, ...) do support ANSI codes anyways.
+                with colorama.colorama_text():
+                    yield
+
+            except ImportError:
                 yield
 
-        except ImportError:
+            del argparse.len  # type: ignore
+        else:
+            # No-op when the context manager is nested.
             yield
 
-        del argparse.len  # type: ignore
-    else:
-        # No-op when the context manager is nested.
-        yield
-
 
 def str_from_rich(
     renderable: RenderableType, width: Optional[int] = None, soft_wrap: bool = False
@@ -893,10 +916,70 @@ class TyroArgumentParser(argparse.ArgumentParser, argparse_sys.ArgumentParser):
         sys.exit(2)
 
 
+class _LazyParserMap(Dict[str, Any]):
+    """Maps subcommand names to parsers. Parsers that are registered with a builder
+    are only created when they're first looked up."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.builder_from_name: Dict[str, Callable[[], argparse.ArgumentParser]] = {}
+
+    def __getitem__(self, name: str) -> argparse.ArgumentParser:
+        if name in self.builder_from_name:
+            self[name] = self.builder_from_name.pop(name)()
+        return super().__getitem__(name)
+
+
+class TyroLazySubparsersAction(argparse._SubParsersAction):
+    """Subparsers action that supports building subparsers lazily. For deeply nested
+    subcommands, this lets us skip building parsers for subcommands that aren't
+    selected from the command-line.
+
+    Only `_SubParsersAction.__call__()` looks up parsers, so lazy subparsers should
+    not be used when the full parser tree is needed, for example for generating
+    completion scripts."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._name_parser_map = _LazyParserMap()
+        self.choices = self._name_parser_map
+
+    def add_lazy_parser(
+        self,
+        name: str,
+        build: Callable[[argparse.ArgumentParser], None],
+        **kwargs,
+    ) -> None:
+        """Mirrors `add_parser()`, but the parser is only created and passed to
+        `build()` when it's first looked up."""
+        if kwargs.get("prog") is None:
+            kwargs["prog"] = "%s %s" % (self._prog_prefix, name)
+
+        if name in self._name_parser_map:
+            raise argparse.ArgumentError(self, _("conflicting subparser: %s") % name)  # type: ignore
+
+        if "help" in kwargs:
+            help = kwargs.pop("help")
+            self._choices_actions.append(self._ChoicesPseudoAction(name, (), help))
+
+        def make_parser() -> argparse.ArgumentParser:
+            parser = self._parser_class(**kwargs)
+            build(parser)
+            return parser
+
+        # Placeholder; the parser is created by `_LazyParserMap.__getitem__()`.
+        dict.__setitem__(self._name_parser_map, name, None)
+        self._name_parser_map.builder_from_name[name] = make_parser
+
+
 class TyroArgparseHelpFormatter(argparse.RawDescriptionHelpFormatter):
     def __init__(self, prog: str):
         indent_increment = 4
-        width = shutil.get_terminal_size().columns - 2
+        width = (
+            shutil.get_terminal_size().columns - 2
+            if _terminal_width is None
+            else _terminal_width
+        )
         max_help_position = 24
         self._fixed_help_position = False
 
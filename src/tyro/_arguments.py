@@ -21,7 +21,6 @@ from typing import (
 )
 
 import rich.markup
-import shtab
 from typing_extensions import get_origin
 
 from . import _argparse as argparse
@@ -36,6 +35,16 @@ from .constructors import (
 _T = TypeVar("_T")
 
 
+def negated_option_string(option_string: str) -> str:
+    """Get the --no-flag counterpart of a --flag option string."""
+    if "." not in option_string:
+        return "--no" + _strings.get_delimeter() + option_string[2:]
+    else:
+        # Loose heuristic for where to add the no-/no_ prefix.
+        left, _, right = option_string.rpartition(".")
+        return left + ".no" + _strings.get_delimeter() + right
+
+
 class BooleanOptionalAction(argparse.Action):
     """Adapted from https://github.com/python/cpython/pull/27672"""
 
@@ -56,14 +65,7 @@ class BooleanOptionalAction(argparse.Action):
             _option_strings.append(option_string)
 
             if option_string.startswith("--"):
-                if "." not in option_string:
-                    option_string = (
-                        "--no" + _strings.get_delimeter() + option_string[2:]
-                    )
-                else:
-                    # Loose heuristic for where to add the no-/no_ prefix.
-                    left, _, right = option_string.rpartition(".")
-                    option_string = left + ".no" + _strings.get_delimeter() + right
+                option_string = negated_option_string(option_string)
                 self._no_strings.add(option_string)
 
                 _option_strings.append(option_string)
@@ -170,6 +172,8 @@ class ArgumentDefinition:
                 or ("str" in str(self.field.type_stripped) and name_suggests_path)
             )
             if complete_as_path:
+                import shtab
+
                 arg.complete = shtab.DIRECTORY if name_suggests_dir else shtab.FILE  # type: ignore
 
     @cached_property
@@ -0,0 +1,2 @@
+"""Parsing backends. These map a list of command-line arguments to a dictionary of
+values, keyed by prefixed field names."""
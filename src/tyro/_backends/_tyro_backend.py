@@ -0,0 +1,605 @@
+"""Lightweight parsing backend that walks a `ParserSpecification` directly.
+
+Building an `argparse.ArgumentParser` requires materializing a parser for every
+subcommand in the tree, which gets very slow for deeply nested subcommands. Instead,
+we build lightweight parser nodes lazily: only for subcommands that are actually
+selected.
+
+Parsing semantics mirror our argparse fork (`_argparse.py` and
+`_argparse_formatter.TyroArgumentParser`). Anything that isn't a clean parse (helptext
+flags, parsing errors, unrecognized arguments, ...) is deferred to argparse, which is
+then responsible for printing the relevant outputs and error messages.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import re
+from typing import Any, Dict, FrozenSet, List, Literal, Sequence, Tuple, cast
+
+from .. import _argparse as argparse
+from .. import _arguments, _parsers, _singleton, _strings
+
+_NEGATIVE_NUMBER_MATCHER = re.compile(r"^-\d+$|^-\d*\.\d+$")
+
+
+class _DeferToArgparse(Exception):
+    """Raised when an input should be handled by argparse instead."""
+
+
+_ActionKind = Literal[
+    "store",
+    "store_true",
+    "store_false",
+    "boolean_optional",
+    "count",
+    "append",
+    "help",
+    "subparsers",
+]
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class _Action:
+    """The subset of `argparse.Action` that we need for parsing."""
+
+    kind: _ActionKind
+    dest: str
+    option_strings: Tuple[str, ...]
+    nargs: int | str | None
+    default: Any
+    required: bool
+    choices: Tuple[str, ...] | None
+
+    # Option strings that set a `boolean_optional` action to False.
+    negated_option_strings: FrozenSet[str] = frozenset()
+
+    # Everything needed to build child parsers for a `subparsers` action.
+    subparsers: _parsers.SubparsersSpecification | None = None
+    force_required_subparsers: bool = False
+    consolidated_specs: Tuple[_parsers.ParserSpecification, ...] = ()
+
+    # Child parser nodes, keyed by subcommand name. Filled lazily.
+    node_from_name: Dict[str, _ParserNode] = dataclasses.field(default_factory=dict)
+
+
+_HELP_ACTION = _Action(
+    kind="help",
+    dest=argparse.SUPPRESS,
+    option_strings=("-h", "--help"),
+    nargs=0,
+    default=argparse.SUPPRESS,
+    required=False,
+    choices=None,
+)
+
+
+@dataclasses.dataclass
+class _ParserNode:
+    """Counterpart of a single (sub)parser in the argparse tree."""
+
+    actions: List[_Action] = dataclasses.field(default_factory=list)
+    action_from_option_string: Dict[str, _Action] = dataclasses.field(
+        default_factory=dict
+    )
+
+    # True if all actions are options that take at most one argument. These can be
+    # parsed without building argument patterns; see `_parse_flat()`.
+    is_flat: bool = True
+
+    def add_action(self, action: _Action) -> None:
+        if not action.option_strings or action.nargs not in (0, None):
+            self.is_flat = False
+        for option_string in action.option_strings:
+            # Conflicting option strings and negative-number-like options both
+            # require special handling in argparse.
+            if (
+                option_string in self.action_from_option_string
+                or _NEGATIVE_NUMBER_MATCHER.match(option_string)
+            ):
+                raise _DeferToArgparse()
+            self.action_from_option_string[option_string] = action
+        self.actions.append(action)
+
+    def parse_optional(
+        self, arg_string: str
+    ) -> Tuple[_Action | None, str, str | None] | None:
+        """Mirrors `argparse.ArgumentParser._parse_optional()`. Returns an
+        (action, option string, explicit argument) tuple for options, or `None` for
+        positional arguments. The action is `None` for unrecognized options, which
+        may still be consumed by a subparser."""
+        if not arg_string or arg_string[0] != "-":
+            return None
+        if arg_string in self.action_from_option_string:
+            return self.action_from_option_string[arg_string], arg_string, None
+        if len(arg_string) == 1:
+            return None
+
+        option_string, sep, explicit_arg = arg_string.partition("=")
+        if sep and option_string in self.action_from_option_string:
+            return (
+                self.action_from_option_string[option_string],
+                option_string,
+                explicit_arg,
+            )
+
+        # Single-dash options can be concatenated, like `-vvv`.
+        if arg_string[1] != "-" and any(
+            s == arg_string[:2] or s.startswith(arg_string)
+            for s in self.action_from_option_string
+        ):
+            raise _DeferToArgparse()
+
+        if _NEGATIVE_NUMBER_MATCHER.match(arg_string) or " " in arg_string:
+            return None
+
+        return None, arg_string, None
+
+
+def build_root_node(parser_spec: _parsers.ParserSpecification) -> _ParserNode | None:
+    """Build the root parser node for a parser specification. Nodes are a pure
+    function of the specification and aren't mutated by parsing, so they can be
+    reused across `tyro.cli()` calls.
+
+    Returns `None` if the parser should be built by argparse instead.
+    """
+    try:
+        return _build_node(
+            parser_spec, force_required_subparsers=False, consolidated_specs=()
+        )
+    except _DeferToArgparse:
+        return None
+
+
+def parse_args(root: _ParserNode, args: Sequence[str]) -> Dict[str, Any] | None:
+    """Parse command-line arguments into a dictionary of values, keyed by prefixed
+    field names. This matches `vars(parser.parse_args(args))` for the argparse parser
+    generated from the same specification as `root`.
+
+    Returns `None` if the arguments should be parsed by argparse instead.
+    """
+    try:
+        namespace: Dict[str, Any] = {}
+        _parse_known_args(root, list(args), namespace)
+        return namespace
+    except _DeferToArgparse:
+        return None
+
+
+def _build_node(
+    parser_spec: _parsers.ParserSpecification,
+    force_required_subparsers: bool,
+    consolidated_specs: Tuple[_parsers.ParserSpecification, ...],
+) -> _ParserNode:
+    """Mirrors `ParserSpecification.apply()`, but without recursing into
+    subparsers."""
+    node = _ParserNode()
+    node.add_action(_HELP_ACTION)
+
+    if parser_spec.consolidate_subcommand_args:
+        if parser_spec.has_required_args:
+            force_required_subparsers = True
+        # Arguments from this parser will be applied to the leaves of the subparser
+        # tree, nearest parsers first.
+        consolidated_specs = (parser_spec,) + consolidated_specs
+
+    if parser_spec.subparsers is not None:
+        subparsers = parser_spec.subparsers
+        node.add_action(
+            _Action(
+                kind="subparsers",
+                dest=_strings.make_subparser_dest(subparsers.intern_prefix),
+                option_strings=(),
+                nargs=argparse.PARSER,
+                default=None,
+                required=subparsers.required or force_required_subparsers,
+                choices=tuple(subparsers.parser_from_name.keys()),
+                subparsers=subparsers,
+                force_required_subparsers=force_required_subparsers,
+                consolidated_specs=consolidated_specs,
+            )
+        )
+        if not parser_spec.consolidate_subcommand_args:
+            _add_args(node, parser_spec)
+    else:
+        if not parser_spec.consolidate_subcommand_args:
+            _add_args(node, parser_spec)
+        for spec in consolidated_specs:
+            _add_args(node, spec)
+
+    return node
+
+
+def _add_args(node: _ParserNode, parser_spec: _parsers.ParserSpecification) -> None:
+    """Mirrors `ParserSpecification.apply_args()`."""
+    for arg in parser_spec.args:
+        if not arg.is_suppressed():
+            node.add_action(_action_from_arg(arg))
+    for child in parser_spec.child_from_prefix.values():
+        _add_args(node, child)
+
+
+def _action_from_arg(arg: _arguments.ArgumentDefinition) -> _Action:
+    """Mirrors `ArgumentDefinition.add_argument()` and
+    `argparse.ArgumentParser.add_argument()`. Anything that argparse would warn or
+    raise an error for is deferred."""
+    lowered = arg.lowered
+    name_or_flags = lowered.name_or_flags
+    if name_or_flags == ("",):
+        name_or_flags = (_strings.dummy_field_name,)
+
+    action = lowered.action
+    nargs = lowered.nargs
+    if action == "count":
+        default = lowered.default
+    elif action == "append":
+        default = []
+    else:
+        default = _singleton.MISSING_NONPROP
+
+    kind: _ActionKind
+    if action is None:
+        kind = "store"
+    elif action in ("append", "store_true", "store_false", "count"):
+        kind = cast(_ActionKind, action)
+    elif action is _arguments.BooleanOptionalAction:
+        kind = "boolean_optional"
+    else:
+        raise _DeferToArgparse()
+
+    if kind in ("store", "append"):
+        if nargs == 0 or not (
+            nargs in (None, argparse.OPTIONAL, argparse.ZERO_OR_MORE)
+            or nargs == argparse.ONE_OR_MORE
+            or isinstance(nargs, int)
+        ):
+            raise _DeferToArgparse()
+    else:
+        if nargs is not None or lowered.choices is not None:
+            raise _DeferToArgparse()
+        if kind != "boolean_optional" and lowered.metavar is not None:
+            raise _DeferToArgparse()
+        nargs = 0
+
+    if len(name_or_flags) == 1 and not name_or_flags[0].startswith("-"):
+        # Positional argument.
+        if lowered.required is not None or lowered.dest is not None:
+            raise _DeferToArgparse()
+        return _Action(
+            kind=kind,
+            dest=name_or_flags[0],
+            option_strings=(),
+            nargs=nargs,
+            default=default,
+            required=nargs not in (argparse.OPTIONAL, argparse.ZERO_OR_MORE),
+            choices=lowered.choices,
+        )
+
+    # Option. Aliases for positional arguments are dropped with a warning, and
+    # options without a prefix raise an error.
+    if (
+        arg.field.is_positional()
+        or lowered.dest is None
+        or not all(s.startswith("-") for s in name_or_flags)
+    ):
+        raise _DeferToArgparse()
+
+    negated_option_strings: FrozenSet[str] = frozenset()
+    if kind == "boolean_optional":
+        negated_option_strings = frozenset(
+            _arguments.negated_option_string(s)
+            for s in name_or_flags
+            if s.startswith("--")
+        )
+        name_or_flags = tuple(
+            s
+            for option_string in name_or_flags
+            for s in (
+                (option_string, _arguments.negated_option_string(option_string))
+                if option_string.startswith("--")
+                else (option_string,)
+            )
+        )
+
+    return _Action(
+        kind=kind,
+        dest=lowered.dest,
+        option_strings=name_or_flags,
+        nargs=nargs,
+        default=default,
+        required=bool(lowered.required),
+        choices=lowered.choices,
+        negated_option_strings=negated_option_strings,
+    )
+
+
+def _nargs_pattern(nargs: int | str | None) -> str:
+    """Mirrors `argparse.ArgumentParser._get_nargs_pattern()`. We defer to argparse
+    when `--` is passed in, so the `-` terms are omitted."""
+    if nargs is None:
+        return "(A)"
+    elif nargs == argparse.OPTIONAL:
+        return "(A?)"
+    elif nargs == argparse.ZERO_OR_MORE:
+        return "(A*)"
+    elif nargs == argparse.ONE_OR_MORE:
+        return "(A+)"
+    elif nargs == argparse.PARSER:
+        return "(A[AO]*)"
+    else:
+        assert isinstance(nargs, int)
+        return "(" + "A" * nargs + ")"
+
+
+def _match_argument(action: _Action, arg_strings_pattern: str) -> int:
+    match = re.match(_nargs_pattern(action.nargs), arg_strings_pattern)
+    if match is None:
+        raise _DeferToArgparse()
+    return len(match.group(1))
+
+
+def _match_arguments_partial(
+    actions: List[_Action], arg_strings_pattern: str
+) -> List[int]:
+    for i in range(len(actions), 0, -1):
+        pattern = "".join(_nargs_pattern(action.nargs) for action in actions[:i])
+        match = re.match(pattern, arg_strings_pattern)
+        if match is not None:
+            return [len(string) for string in match.groups()]
+    return []
+
+
+def _check_value(action: _Action, value: Any) -> None:
+    # Like `TyroArgumentParser._check_value()`, we ignore sentinel values.
+    if value in _singleton.MISSING_AND_MISSING_NONPROP:
+        return
+    if action.choices is not None and value not in action.choices:
+        raise _DeferToArgparse()
+
+
+def _get_values(action: _Action, arg_strings: List[str]) -> Any:
+    """Mirrors `argparse.ArgumentParser._get_values()`. We never set `type=`, so
+    values are always strings."""
+    value: Any
+    if not arg_strings and action.nargs == argparse.OPTIONAL:
+        value = None if action.option_strings else action.default
+        if isinstance(value, str):
+            _check_value(action, value)
+    elif (
+        not arg_strings
+        and action.nargs == argparse.ZERO_OR_MORE
+        and not action.option_strings
+    ):
+        if action.default is not None:
+            value = action.default
+            _check_value(action, value)
+        else:
+            value = arg_strings
+    elif len(arg_strings) == 1 and action.nargs in (None, argparse.OPTIONAL):
+        (value,) = arg_strings
+        _check_value(action, value)
+    elif action.nargs == argparse.PARSER:
+        value = list(arg_strings)
+        _check_value(action, value[0])
+    else:
+        value = list(arg_strings)
+        for v in value:
+            _check_value(action, v)
+    return value
+
+
+def _take_action(
+    action: _Action,
+    namespace: Dict[str, Any],
+    value: Any,
+    option_string: str | None,
+) -> None:
+    """Mirrors the `__call__()` implementations of argparse actions."""
+    kind = action.kind
+    if kind == "store":
+        namespace[action.dest] = value
+    elif kind == "store_true":
+        namespace[action.dest] = True
+    elif kind == "store_false":
+        namespace[action.dest] = False
+    elif kind == "boolean_optional":
+        namespace[action.dest] = option_string not in action.negated_option_strings
+    elif kind == "count":
+        count = namespace.get(action.dest, None)
+        namespace[action.dest] = (0 if count is None else count) + 1
+    elif kind == "append":
+        items = namespace.get(action.dest, None)
+        if items is None:
+            items = []
+        elif type(items) is list:
+            items = items[:]
+        else:
+            items = copy.copy(items)
+        items.append(value)
+        namespace[action.dest] = items
+    elif kind == "subparsers":
+        assert action.subparsers is not None
+        parser_name = value[0]
+        namespace[action.dest] = parser_name
+        if parser_name in action.node_from_name:
+            child = action.node_from_name[parser_name]
+        else:
+            child = _build_node(
+                action.subparsers.parser_from_name[parser_name],
+                force_required_subparsers=action.force_required_subparsers,
+                consolidated_specs=action.consolidated_specs,
+            )
+            action.node_from_name[parser_name] = child
+        _parse_known_args(child, value[1:], namespace)
+    else:
+        # Helptext is printed by argparse.
+        assert kind == "help"
+        raise _DeferToArgparse()
+
+
+def _set_defaults(node: _ParserNode, namespace: Dict[str, Any]) -> None:
+    """Set default values for a parser node. argparse parses each subparser into a
+    new namespace, which is then merged into the parent's; we write into a single
+    dictionary instead, so defaults override values that are already set."""
+    dests = set()
+    for action in node.actions:
+        if action.dest is not argparse.SUPPRESS and action.dest not in dests:
+            dests.add(action.dest)
+            # Parser nodes are reused, so list defaults (from `append` actions)
+            # shouldn't be shared between parses.
+            namespace[action.dest] = (
+                action.default[:] if type(action.default) is list else action.default
+            )
+
+
+def _parse_known_args(
+    node: _ParserNode, arg_strings: List[str], namespace: Dict[str, Any]
+) -> None:
+    """Mirrors `TyroArgumentParser._parse_known_args()`, but writes parsed values to
+    `namespace`. Instead of returning extra arguments, we defer to argparse when any
+    are found."""
+    if node.is_flat:
+        _parse_flat(node, arg_strings, namespace)
+        return
+
+    _set_defaults(node, namespace)
+
+    # Find all option indices, and determine the arg_string_pattern which has an 'O'
+    # if there is an option at an index and an 'A' if there is an argument.
+    option_tuple_from_index: Dict[int, Tuple[_Action | None, str, str | None]] = {}
+    arg_string_pattern_parts: List[str] = []
+    for i, arg_string in enumerate(arg_strings):
+        if arg_string == "--":
+            raise _DeferToArgparse()
+        option_tuple = node.parse_optional(arg_string)
+        if option_tuple is None:
+            arg_string_pattern_parts.append("A")
+        else:
+            option_tuple_from_index[i] = option_tuple
+            arg_string_pattern_parts.append("O")
+    arg_strings_pattern = "".join(arg_string_pattern_parts)
+
+    seen_actions = set()
+
+    def take_action(
+        action: _Action, argument_strings: List[str], option_string: str | None = None
+    ) -> None:
+        seen_actions.add(action)
+        value = _get_values(action, argument_strings)
+        _take_action(action, namespace, value, option_string)
+
+    def consume_optional(start_index: int) -> int:
+        action, option_string, explicit_arg = option_tuple_from_index[start_index]
+        if action is None:
+            # Unrecognized option.
+            raise _DeferToArgparse()
+        if explicit_arg is not None:
+            # Explicit arguments are only supported for single-argument options;
+            # concatenated single-dash options and errors are handled by argparse.
+            if _match_argument(action, "A") != 1:
+                raise _DeferToArgparse()
+            take_action(action, [explicit_arg], option_string)
+            return start_index + 1
+        else:
+            start = start_index + 1
+            stop = start + _match_argument(action, arg_strings_pattern[start:])
+            take_action(action, arg_strings[start:stop], option_string)
+            return stop
+
+    positionals = [action for action in node.actions if not action.option_strings]
+
+    def consume_positionals(start_index: int) -> int:
+        arg_counts = _match_arguments_partial(
+            positionals, arg_strings_pattern[start_index:]
+        )
+        for action, arg_count in zip(positionals, arg_counts):
+            args = arg_strings[start_index : start_index + arg_count]
+            start_index += arg_count
+            take_action(action, args)
+        positionals[:] = positionals[len(arg_counts) :]
+        return start_index
+
+    # Consume positionals and options alternately, until we have passed the last
+    # option string.
+    start_index = 0
+    max_option_string_index = max(option_tuple_from_index, default=-1)
+    while start_index <= max_option_string_index:
+        next_option_string_index = min(
+            index for index in option_tuple_from_index if index >= start_index
+        )
+        if start_index != next_option_string_index:
+            positionals_end_index = consume_positionals(start_index)
+            if positionals_end_index > start_index:
+                start_index = positionals_end_index
+                continue
+            else:
+                start_index = positionals_end_index
+
+        # Positional arguments that we couldn't consume are unrecognized.
+        if start_index not in option_tuple_from_index:
+            raise _DeferToArgparse()
+
+        start_index = consume_optional(start_index)
+
+    # Consume any positionals following the last option. Leftovers are unrecognized.
+    if consume_positionals(start_index) != len(arg_strings):
+        raise _DeferToArgparse()
+
+    # Errors for missing required arguments are generated by argparse.
+    for action in node.actions:
+        if action.required and action not in seen_actions:
+            raise _DeferToArgparse()
+
+
+def _parse_flat(
+    node: _ParserNode, arg_strings: List[str], namespace: Dict[str, Any]
+) -> None:
+    """Fast path of `_parse_known_args()` for flat parsers: no positional arguments,
+    no subparsers, and only options that take zero or one arguments. Every option is
+    followed by either nothing or a single value, so we can walk the arguments
+    once instead of matching argument patterns."""
+    _set_defaults(node, namespace)
+
+    seen_actions = set()
+    index = 0
+    while index < len(arg_strings):
+        if arg_strings[index] == "--":
+            raise _DeferToArgparse()
+        option_tuple = node.parse_optional(arg_strings[index])
+        if option_tuple is None:
+            # Unrecognized positional argument.
+            raise _DeferToArgparse()
+        action, option_string, explicit_arg = option_tuple
+        if action is None:
+            # Unrecognized option.
+            raise _DeferToArgparse()
+        index += 1
+
+        argument_strings: List[str]
+        if action.nargs == 0:
+            # Concatenated single-dash options and errors are handled by argparse.
+            if explicit_arg is not None:
+                raise _DeferToArgparse()
+            argument_strings = []
+        elif explicit_arg is not None:
+            argument_strings = [explicit_arg]
+        else:
+            # A missing value is an error, which is reported by argparse.
+            if (
+                index == len(arg_strings)
+                or arg_strings[index] == "--"
+                or node.parse_optional(arg_strings[index]) is not None
+            ):
+                raise _DeferToArgparse()
+            argument_strings = [arg_strings[index]]
+            index += 1
+
+        seen_actions.add(action)
+        value = _get_values(action, argument_strings)
+        _take_action(action, namespace, value, option_string)
+
+    # Errors for missing required arguments are generated by argparse.
+    for action in node.actions:
+        if action.required and action not in seen_actions:
+            raise _DeferToArgparse()
@@ -25,6 +25,42 @@ class InstantiationError(Exception):
 
 T = TypeVar("T")
 
+# Arguments keyed by prefixed field name, and the prefixed name of each field in
+# `parser_definition.field_list`. These only depend on the parser specification and
+# field name prefix, so they're stored with cached specifications and reused across
+# `tyro.cli()` calls.
+_CallPlan = Tuple[Dict[str, _arguments.ArgumentDefinition], Tuple[str, ...]]
+
+# Call plans keyed by (specification id, field name prefix). Nested specifications
+# are kept alive by the root specification that the dictionary is stored with.
+CallPlans = Dict[Tuple[int, str], _CallPlan]
+
+
+def _get_call_plan(
+    parser_definition: _parsers.ParserSpecification,
+    field_name_prefix: str,
+    call_plans: CallPlans,
+) -> _CallPlan:
+    """Get arguments keyed by prefixed field name, and the prefixed name of each
+    field in `parser_definition.field_list`."""
+    cache_key = (id(parser_definition), field_name_prefix)
+    if cache_key in call_plans:
+        return call_plans[cache_key]
+
+    arg_from_prefixed_field_name: Dict[str, _arguments.ArgumentDefinition] = {}
+    for arg in parser_definition.args:
+        arg_from_prefixed_field_name[
+            _strings.make_field_name([arg.intern_prefix, arg.field.intern_name])
+        ] = arg
+    prefixed_field_names = tuple(
+        _strings.make_field_name([field_name_prefix, field.intern_name])
+        for field in parser_definition.field_list
+    )
+
+    plan = (arg_from_prefixed_field_name, prefixed_field_names)
+    call_plans[cache_key] = plan
+    return plan
+
 
 def callable_with_args(
     f: Callable[..., T],
@@ -32,6 +68,8 @@ def callable_with_args(
     default_instance: Union[T, _singleton.NonpropagatingMissingType],
     value_from_prefixed_field_name: Dict[str, Any],
     field_name_prefix: str,
+    *,
+    call_plans: CallPlans,
 ) -> Tuple[Callable[[], T], Set[str]]:
     """Populate `f` with arguments specified by a dictionary of values from argparse.
 
@@ -72,19 +110,16 @@ def callable_with_args(
         else:
             return value_from_prefixed_field_name[prefixed_field_name], True
 
-    arg_from_prefixed_field_name: Dict[str, _arguments.ArgumentDefinition] = {}
-    for arg in parser_definition.args:
-        arg_from_prefixed_field_name[
-            _strings.make_field_name([arg.intern_prefix, arg.field.intern_name])
-        ] = arg
+    arg_from_prefixed_field_name, prefixed_field_names = _get_call_plan(
+        parser_definition, field_name_prefix, call_plans
+    )
 
     any_arguments_provided = False
 
-    for field in parser_definition.field_list:
+    for field, prefixed_field_name in zip(
+        parser_definition.field_list, prefixed_field_names
+    ):
         value: Any
-        prefixed_field_name = _strings.make_field_name(
-            [field_name_prefix, field.intern_name]
-        )
 
         # Resolve field type.
         field_type = field.type_stripped
@@ -160,6 +195,7 @@ def callable_with_args(
                 field.default,
                 value_from_prefixed_field_name,
                 field_name_prefix=prefixed_field_name,
+                call_plans=call_plans,
             )
             value = get_value()
             del get_value
@@ -202,6 +238,7 @@ def callable_with_args(
                     ),
                     value_from_prefixed_field_name,
                     field_name_prefix=prefixed_field_name,
+                    call_plans=call_plans,
                 )
                 value = get_value()
                 del get_value
@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import contextlib
 import dataclasses
+import enum
+import os
 import pathlib
 import sys
+import types
 import warnings
-from typing import Callable, Literal, Sequence, TypeVar, cast, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Literal,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+    overload,
+)
 
-import shtab
 from typing_extensions import Annotated
 
 from . import _argparse as argparse
@@ -23,8 +39,10 @@ from . import (
     _unsafe_cache,
     conf,
 )
+from ._backends import _tyro_backend
 from ._typing import TypeForm
-from .constructors import ConstructorRegistry
+from .constructors import ConstructorRegistry, _struct_spec
+from .constructors._registry import check_default_instances
 
 OutT = TypeVar("OutT")
 
@@ -225,8 +243,8 @@ def cli(
         run_with_args_from_cli = output[0]
         return run_with_args_from_cli(), output[1]
     else:
-        run_with_args_from_cli = cast(Callable[[], OutT], output)
-        return run_with_args_from_cli()
+        run_with_args_from_cli = output
+        return run_with_args_from_cli()  # type: ignore
 
 
 @overload
@@ -332,18 +350,8 @@ def _cli_impl(
     if config is not None:
         f = Annotated[(f, *config)]  # type: ignore
 
-    if "default_instance" in deprecated_kwargs:
-        warnings.warn(
-            "`default_instance=` is deprecated! use `default=` instead.", stacklevel=2
-        )
-        default = deprecated_kwargs["default_instance"]
-    if deprecated_kwargs.get("avoid_subparsers", False):
-        f = conf.AvoidSubcommands[f]  # type: ignore
-        warnings.warn(
-            "`avoid_subparsers=` is deprecated! use `tyro.conf.AvoidSubcommands[]`"
-            " instead.",
-            stacklevel=2,
-        )
+    if deprecated_kwargs:
+        f, default = _handle_deprecated(f, default, deprecated_kwargs)
 
     # Internally, we distinguish between two concepts:
     # - "default", which is used for individual arguments.
@@ -358,24 +366,21 @@ def _cli_impl(
     # We wrap our type with a dummy dataclass if it can't be treated as a nested type.
     # For example: passing in f=int will result in a dataclass with a single field
     # typed as int.
-    if not _fields.is_struct_type(cast(type, f), default_instance_internal):
-        dummy_field = cast(
-            dataclasses.Field,
-            dataclasses.field(),
-        )
-        f = dataclasses.make_dataclass(
-            cls_name="dummy",
-            fields=[(_strings.dummy_field_name, cast(type, f), dummy_field)],
-            frozen=True,
-        )
-        default_instance_internal = f(default_instance_internal)  # type: ignore
+    unwrapped_default = default_instance_internal
+    if not _is_struct_type(f, default_instance_internal):
+        f = _get_dummy_wrapper(f)
+        # Without a default, the dummy field is also missing a default. Skipping
+        # the dummy instance here lets us reuse cached parser specifications.
+        if default_instance_internal is not _singleton.MISSING_NONPROP:
+            default_instance_internal = f(default_instance_internal)  # type: ignore
         dummy_wrapped = True
     else:
         dummy_wrapped = False
 
     # Read and fix arguments. If the user passes in --field_name instead of
-    # --field-name, correct for them.
-    args = list(sys.argv[1:]) if args is None else list(args)
+    # --field-name, correct for them. Slicing `sys.argv` already produces a new list, so
+    # we only copy when arguments are passed in.
+    args = sys.argv[1:] if args is None else list(args)
 
     # Fix arguments. This will modify all option-style arguments replacing
     # underscores with hyphens, or vice versa if use_underscores=True.
@@ -414,10 +419,9 @@ def _cli_impl(
     write_completion = False
     if len(args) >= 2:
         # We replace underscores with hyphens to accomodate for `use_undercores`.
-        print_completion = args[0].replace("_", "-") == "--tyro-print-completion"
-        write_completion = (
-            len(args) >= 3 and args[0].replace("_", "-") == "--tyro-write-completion"
-        )
+        first_arg = args[0].replace("_", "-")
+        print_completion = first_arg == "--tyro-print-completion"
+        write_completion = len(args) >= 3 and first_arg == "--tyro-write-completion"
 
     # Note: setting USE_RICH must happen before the parser specification is generated.
     # TODO: revisit this. Ideally we should be able to eliminate the global state
@@ -436,90 +440,112 @@ def _cli_impl(
     # Map a callable to the relevant CLI arguments + subparsers.
     if registry is not None:
         with registry:
-            parser_spec = _parsers.ParserSpecification.from_callable_or_type(
-                f,
-                markers=set(),
-                description=description,
-                parent_classes=set(),  # Used for recursive calls.
-                default_instance=default_instance_internal,  # Overrides for default values.
-                intern_prefix="",  # Used for recursive calls.
-                extern_prefix="",  # Used for recursive calls.
+            spec_entry = _get_parser_spec(
+                f, description, default_instance_internal, unwrapped_default
             )
     else:
-        parser_spec = _parsers.ParserSpecification.from_callable_or_type(
-            f,
-            markers=set(),
-            description=description,
-            parent_classes=set(),  # Used for recursive calls.
-            default_instance=default_instance_internal,  # Overrides for default values.
-            intern_prefix="",  # Used for recursive calls.
-            extern_prefix="",  # Used for recursive calls.
+        spec_entry = _get_parser_spec(
+            f, description, default_instance_internal, unwrapped_default
         )
-
-    # Generate parser!
-    with _argparse_formatter.ansi_context():
-        parser = _argparse_formatter.TyroArgumentParser(
-            prog=prog,
-            formatter_class=_argparse_formatter.TyroArgparseHelpFormatter,
-            allow_abbrev=False,
-        )
-        parser._parser_specification = parser_spec
-        parser._parsing_known_args = return_unknown_args
-        parser._console_outputs = console_outputs
-        parser._args = args
-        parser_spec.apply(parser, force_required_subparsers=False)
-
-        # Print help message when no arguments are passed in. (but arguments are
-        # expected)
-        # if len(args) == 0 and parser_spec.has_required_args:
-        #     args = ["--help"]
-
-        if return_parser:
-            _arguments.USE_RICH = True
-            return parser
-
-        if print_completion or write_completion:
-            _arguments.USE_RICH = True
-            assert completion_shell in (
-                "bash",
-                "zsh",
-                "tcsh",
-            ), (
-                "Shell should be one `bash`, `zsh`, or `tcsh`, but got"
-                f" {completion_shell}"
+    parser_spec = spec_entry.parser_spec
+
+    # Parse arguments. By default, we use a lightweight backend that walks the parser
+    # specification directly. argparse is still used for generating parsers,
+    # completion scripts, helptext, and error messages.
+    value_from_prefixed_field_name = None
+    unknown_args: list[str] | None = None
+    if (
+        os.environ.get("PYTHON_TYRO_BACKEND", "tyro") != "argparse"
+        and not return_parser
+        and not print_completion
+        and not write_completion
+    ):
+        root_node = spec_entry.get_root_node()
+        if root_node is not None:
+            value_from_prefixed_field_name = _tyro_backend.parse_args(root_node, args)
+        if return_unknown_args and value_from_prefixed_field_name is not None:
+            unknown_args = []
+
+    if value_from_prefixed_field_name is None:
+        # Generate parser!
+        with _argparse_formatter.ansi_context():
+            parser = _argparse_formatter.TyroArgumentParser(
+                prog=prog,
+                formatter_class=_argparse_formatter.TyroArgparseHelpFormatter,
+                allow_abbrev=False,
+            )
+            parser._parser_specification = parser_spec
+            parser._parsing_known_args = return_unknown_args
+            parser._console_outputs = console_outputs
+            parser._args = args
+            parser_spec.apply(
+                parser,
+                force_required_subparsers=False,
+                # The full parser tree is needed if we return it or generate
+                # completion scripts. Otherwise, we only build subparsers that are
+                # selected from the command-line.
+                lazy_subparsers=not (
+                    return_parser or print_completion or write_completion
+                ),
             )
 
-            if write_completion and completion_target_path != pathlib.Path("-"):
-                assert completion_target_path is not None
-                completion_target_path.write_text(
-                    shtab.complete(
-                        parser=parser,
-                        shell=completion_shell,
-                        root_prefix=f"tyro_{parser.prog}",
-                    )
+            # Print help message when no arguments are passed in. (but arguments are
+            # expected)
+            # if len(args) == 0 and parser_spec.has_required_args:
+            #     args = ["--help"]
+
+            if return_parser:
+                _arguments.USE_RICH = True
+                return parser
+
+            if print_completion or write_completion:
+                # shtab is only needed for completion scripts, so we import it lazily.
+                import shtab
+
+                _arguments.USE_RICH = True
+                assert completion_shell in (
+                    "bash",
+                    "zsh",
+                    "tcsh",
+                ), (
+                    "Shell should be one `bash`, `zsh`, or `tcsh`, but got"
+                    f" {completion_shell}"
                 )
-            else:
-                print(
-                    shtab.complete(
-                        parser=parser,
-                        shell=completion_shell,
-                        root_prefix=f"tyro_{parser.prog}",
+
+                if write_completion and completion_target_path != pathlib.Path("-"):
+                    assert completion_target_path is not None
+                    completion_target_path.write_text(
+                        shtab.complete(
+                            parser=parser,
+                            shell=completion_shell,
+                            root_prefix=f"tyro_{parser.prog}",
+                        )
                     )
-                )
-            sys.exit()
+                else:
+                    print(
+                        shtab.complete(
+                            parser=parser,
+                            shell=completion_shell,
+                            root_prefix=f"tyro_{parser.prog}",
+                        )
+                    )
+                sys.exit()
 
-        if return_unknown_args:
-            namespace, unknown_args = parser.parse_known_args(args=args)
-        else:
-            unknown_args = None
-            namespace = parser.parse_args(args=args)
-        value_from_prefixed_field_name = vars(namespace)
+            if return_unknown_args:
+                namespace, unknown_args = parser.parse_known_args(args=args)
+            else:
+                unknown_args = None
+                namespace = parser.parse_args(args=args)
+            value_from_prefixed_field_name = vars(namespace)
 
     if dummy_wrapped:
-        value_from_prefixed_field_name = {
-            k.replace(_strings.dummy_field_name, ""): v
-            for k, v in value_from_prefixed_field_name.items()
-        }
+        # Strip the dummy field name from keys in-place. This is cheaper than
+        # rebuilding the dictionary. `_strings.make_field_name()` drops dummy field
+        # names, so they can only appear as prefixes.
+        d = value_from_prefixed_field_name
+        prefix_len = len(_strings.dummy_field_name)
+        for k in [k for k in d if k.startswith(_strings.dummy_field_name)]:
+            d[k[prefix_len:]] = d.pop(k)
 
     try:
         # Attempt to call `f` using whatever was passed in.
@@ -529,6 +555,7 @@ def _cli_impl(
             default_instance_internal,
             value_from_prefixed_field_name,
             field_name_prefix="",
+            call_plans=spec_entry.call_plans,
         )
     except _calling.InstantiationError as e:
         # Print prettier errors.
@@ -546,6 +573,9 @@ def _cli_impl(
 
         from ._argparse_formatter import THEME
 
+        # Matches the default `prog` of `argparse.ArgumentParser`, which may not have
+        # been built.
+        prog_name = prog if prog is not None else os.path.basename(sys.argv[0])
         if console_outputs:
             console = Console(theme=THEME.as_rich_theme(), stderr=True)
             console.print(
@@ -570,7 +600,7 @@ def _cli_impl(
                                         pad=(0, 0, 0, 4),
                                     ),
                                     Rule(style=Style(color="red")),
-                                    f"For full helptext, see [bold]{parser.prog} --help[/bold]",
+                                    f"For full helptext, see [bold]{prog_name} --help[/bold]",
                                 ]
                             ),
                         ),
@@ -582,7 +612,7 @@ def _cli_impl(
             )
         sys.exit(2)
 
-    assert len(value_from_prefixed_field_name.keys() - consumed_keywords) == 0, (
+    assert consumed_keywords.issuperset(value_from_prefixed_field_name), (
         f"Parsed {value_from_prefixed_field_name.keys()}, but only consumed"
         f" {consumed_keywords}"
     )
@@ -600,3 +630,261 @@ def _cli_impl(
     else:
         assert unknown_args is None, "Should have parsed with `parse_args()`"
         return get_out  # type: ignore
+
+
+def _handle_deprecated(
+    f: TypeForm[OutT] | Callable[..., OutT],
+    default: None | OutT,
+    deprecated_kwargs: Dict[str, Any],
+) -> Tuple[TypeForm[OutT] | Callable[..., OutT], None | OutT]:
+    """Apply deprecated keyword arguments to `f` and `default`."""
+    if "default_instance" in deprecated_kwargs:
+        warnings.warn(
+            "`default_instance=` is deprecated! use `default=` instead.", stacklevel=3
+        )
+        default = deprecated_kwargs["default_instance"]
+    if deprecated_kwargs.get("avoid_subparsers", False):
+        f = conf.AvoidSubcommands[f]  # type: ignore
+        warnings.warn(
+            "`avoid_subparsers=` is deprecated! use `tyro.conf.AvoidSubcommands[]`"
+            " instead.",
+            stacklevel=3,
+        )
+    return f, default
+
+
+# Results of `_fields.is_struct_type()` for `tyro.cli()` inputs. The function's own
+# cache is cleared after every `tyro.cli()` call.
+_is_struct_type_cache: _unsafe_cache.PersistentCache[Tuple[Any, ...], bool] = (
+    _unsafe_cache.PersistentCache(maxsize=256)
+)
+
+
+def _is_struct_type(f: TypeForm[Any] | Callable, default_instance: Any) -> bool:
+    """Cached version of `_fields.is_struct_type()`, for inputs to `tyro.cli()`."""
+    if not _is_cacheable_input(f) or not _is_immutable(default_instance):
+        return _fields.is_struct_type(f, default_instance)
+
+    cache_key = (id(f), type(default_instance), default_instance, _get_global_state())
+    out = _is_struct_type_cache.get(cache_key)
+    if out is None:
+        with _record_shown_warnings() as shown_warnings:
+            out = _fields.is_struct_type(f, default_instance)
+        if len(shown_warnings) == 0:
+            _is_struct_type_cache.set(cache_key, out, keep_alive=f)
+    return out
+
+
+def _get_global_state() -> Hashable:
+    """Get a hashable summary of global state that cached values depend on. Rules can
+    be added to constructor registries at any time, so we include rule counts."""
+    return tuple(
+        (registry, len(registry._primitive_rules), len(registry._struct_rules))
+        for registry in ConstructorRegistry._active_registries
+    )
+
+
+@contextlib.contextmanager
+def _record_shown_warnings() -> Iterator[List[Any]]:
+    """Record warnings that are shown in this context. Values computed while
+    warnings are shown shouldn't be cached; cache hits would silence them.
+
+    Unlike `warnings.catch_warnings()`, this doesn't change how warnings are filtered
+    or displayed. Entering `catch_warnings()` also resets the registries used to
+    deduplicate warnings, which would make warnings that were already shown once
+    show up again.
+    """
+    shown: List[Any] = []
+    showwarning = warnings.showwarning
+
+    def recording_showwarning(message: Any, *args: Any, **kwargs: Any) -> None:
+        shown.append(message)
+        showwarning(message, *args, **kwargs)
+
+    warnings.showwarning = recording_showwarning
+    try:
+        yield shown
+    finally:
+        warnings.showwarning = showwarning
+
+
+def _is_cacheable_input(f: TypeForm[Any] | Callable) -> bool:
+    """Check whether results for a `tyro.cli()` input can be cached.
+
+    Caches are keyed by the input's `id()`, not by equality: `Union[str, int] ==
+    Union[int, str]`, but union members are tried in order. Unhashable types aren't
+    deduplicated by `typing`, so they're typically rebuilt for each call and would
+    never be hit.
+    """
+    try:
+        hash(f)
+    except TypeError:
+        return False
+    return True
+
+
+# Dummy dataclasses used to wrap types that can't be treated as nested types. These
+# are cached to avoid running `dataclasses.make_dataclass()` for every `tyro.cli()`
+# call; wrapper classes are also part of parser specification cache keys.
+_dummy_wrapper_cache: _unsafe_cache.PersistentCache[int, Callable] = (
+    _unsafe_cache.PersistentCache(maxsize=64)
+)
+
+
+def _get_dummy_wrapper(f: TypeForm[Any] | Callable) -> Callable:
+    """Get a dummy dataclass with a single field, typed as `f`."""
+    cacheable = _is_cacheable_input(f)
+    if cacheable:
+        wrapper = _dummy_wrapper_cache.get(id(f))
+        if wrapper is not None:
+            return wrapper
+
+    # Field objects are mutated when dataclasses are created, so we can't share one
+    # between wrappers. We don't need one anyways: the dummy field has no default.
+    wrapper = dataclasses.make_dataclass(
+        cls_name="dummy",
+        fields=[(_strings.dummy_field_name, f)],
+        frozen=True,
+    )
+    if cacheable:
+        _dummy_wrapper_cache.set(id(f), wrapper, keep_alive=f)
+    return wrapper
+
+
+@dataclasses.dataclass
+class _ParserSpecEntry:
+    """A parser specification, and data derived from it. Entries are reused across
+    `tyro.cli()` calls when the specification is cached."""
+
+    parser_spec: _parsers.ParserSpecification
+    call_plans: _calling.CallPlans = dataclasses.field(default_factory=dict)
+    root_node: _tyro_backend._ParserNode | None = None
+    # `root_node` is `None` both before it's built and when the backend can't handle
+    # the specification, so we track whether it's been built separately.
+    root_node_built: bool = False
+
+    def get_root_node(self) -> _tyro_backend._ParserNode | None:
+        """Get the root node for the tyro parsing backend, which is built lazily.
+        Returns `None` if parsing should be deferred to argparse."""
+        if not self.root_node_built:
+            self.root_node = _tyro_backend.build_root_node(self.parser_spec)
+            self.root_node_built = True
+        return self.root_node
+
+
+# Parser specifications are expensive to generate, so we cache them across
+# `tyro.cli()` calls. Keys are the inputs to `_get_parser_spec()` + any global state
+# that affects the specification.
+_parser_spec_cache: _unsafe_cache.PersistentCache[Tuple[Any, ...], _ParserSpecEntry] = (
+    _unsafe_cache.PersistentCache(maxsize=64)
+)
+
+
+def _get_parser_spec(
+    f: Callable,
+    description: None | str,
+    default_instance: Any,
+    unwrapped_default: Any,
+) -> _ParserSpecEntry:
+    """Get the parser specification for a callable, and data derived from it.
+    Specifications are reused when all of their default values are immutable.
+
+    `unwrapped_default` is the default passed into `tyro.cli()`. This differs from
+    `default_instance` for dummy-wrapped types, where a new wrapper instance is
+    created for every call."""
+
+    cache_key: Tuple[Any, ...] | None = None
+    if _is_cacheable_input(f) and _is_immutable(default_instance):
+        cache_key = (
+            id(f),
+            description,
+            # Defaults are compared by identity; equality is too loose. For example,
+            # `1 == True`.
+            id(unwrapped_default),
+            _strings.get_delimeter(),
+            _arguments.USE_RICH,
+            check_default_instances(),
+            _get_global_state(),
+        )
+        entry = _parser_spec_cache.get(cache_key)
+        if entry is not None:
+            return entry
+
+    dynamic_default_count = _struct_spec.dynamic_default_count()
+    with _record_shown_warnings() as shown_warnings:
+        parser_spec = _parsers.ParserSpecification.from_callable_or_type(
+            f,
+            markers=set(),
+            description=description,
+            parent_classes=set(),  # Used for recursive calls.
+            default_instance=default_instance,  # Overrides for default values.
+            intern_prefix="",  # Used for recursive calls.
+            extern_prefix="",  # Used for recursive calls.
+        )
+
+    # Default values are stored in the specification and returned directly when
+    # arguments aren't passed in. We shouldn't share these between calls if they're
+    # mutable, or if they're computed dynamically (for example, by a `default_factory`
+    # that returns a timestamp).
+    entry = _ParserSpecEntry(parser_spec)
+    if (
+        cache_key is not None
+        and len(shown_warnings) == 0
+        and _struct_spec.dynamic_default_count() == dynamic_default_count
+        and _has_immutable_defaults(parser_spec)
+    ):
+        _parser_spec_cache.set(cache_key, entry, keep_alive=(f, default_instance))
+    return entry
+
+
+def _has_immutable_defaults(parser_spec: _parsers.ParserSpecification) -> bool:
+    """Check that all default values in a parser specification are immutable."""
+    if not all(_is_immutable(field.default) for field in parser_spec.field_list):
+        return False
+    for child in parser_spec.child_from_prefix.values():
+        if not _has_immutable_defaults(child):
+            return False
+    for subparsers in parser_spec.subparsers_from_intern_prefix.values():
+        if not _is_immutable(subparsers.default_instance):
+            return False
+        for subparser in subparsers.parser_from_name.values():
+            if not _has_immutable_defaults(subparser):
+                return False
+    return True
+
+
+def _is_immutable(value: Any) -> bool:
+    """Conservative check for whether a value is immutable. Hashability isn't
+    enough: objects with identity-based hashes can still be mutable."""
+    if (
+        value is None
+        or value is Ellipsis
+        or type(value) in (bool, int, float, complex, str, bytes)
+        or isinstance(
+            value,
+            (
+                enum.Enum,
+                pathlib.PurePath,
+                type,
+                types.FunctionType,
+                types.BuiltinFunctionType,
+            ),
+        )
+        or any(value is s for s in _singleton.DEFAULT_SENTINEL_SINGLETONS)
+    ):
+        return True
+    if type(value) in (tuple, frozenset) or (
+        # NamedTuple instances.
+        isinstance(value, tuple) and hasattr(type(value), "_fields")
+    ):
+        return all(_is_immutable(v) for v in value)
+    if (
+        dataclasses.is_dataclass(value)
+        and not isinstance(value, type)
+        and type(value).__dataclass_params__.frozen  # type: ignore
+    ):
+        return all(
+            _is_immutable(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        )
+    return False
@@ -29,6 +29,21 @@ global_context_markers: List[Tuple[_markers.Marker, ...]] = []
 
 @dataclasses.dataclass
 class FieldDefinition:
+    # Slots make attribute access faster. `dataclasses.dataclass(slots=True)` requires
+    # Python 3.10, so we list them manually.
+    __slots__ = (
+        "intern_name",
+        "extern_name",
+        "type",
+        "type_stripped",
+        "default",
+        "helptext",
+        "markers",
+        "custom_constructor",
+        "argconf",
+        "call_argname",
+    )
+
     intern_name: str
     extern_name: str
     type: TypeForm[Any] | Callable
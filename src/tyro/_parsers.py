@@ -37,6 +37,24 @@ T = TypeVar("T")
 class ParserSpecification:
     """Each parser contains a list of arguments and optionally some subparsers."""
 
+    # Slots make attribute access faster. `dataclasses.dataclass(slots=True)` requires
+    # Python 3.10, so we list them manually; fields can't have class-level defaults.
+    __slots__ = (
+        "f",
+        "markers",
+        "description",
+        "args",
+        "field_list",
+        "child_from_prefix",
+        "helptext_from_intern_prefixed_field_name",
+        "subparsers",
+        "subparsers_from_intern_prefix",
+        "intern_prefix",
+        "extern_prefix",
+        "has_required_args",
+        "consolidate_subcommand_args",
+    )
+
     f: Callable
     markers: Set[_markers._Marker]
     description: str
@@ -200,9 +218,18 @@ class ParserSpecification:
         )
 
     def apply(
-        self, parser: argparse.ArgumentParser, force_required_subparsers: bool
-    ) -> Tuple[argparse.ArgumentParser, ...]:
-        """Create defined arguments and subparsers."""
+        self,
+        parser: argparse.ArgumentParser,
+        force_required_subparsers: bool,
+        consolidated_specs: Tuple[ParserSpecification, ...] = (),
+        lazy_subparsers: bool = False,
+    ) -> None:
+        """Create defined arguments and subparsers.
+
+        `consolidated_specs` contains parent parsers whose arguments should be
+        applied to the leaves of the subparser tree, nearest parsers first. If
+        `lazy_subparsers` is set, subparsers are only built when they're selected
+        from the command-line."""
 
         # Generate helptext.
         parser.description = self.description
@@ -211,27 +238,27 @@ class ParserSpecification:
         # consolidating all arguments into the leaves of the subparser trees, a
         # required argument in one node of this tree means that all of its
         # descendants are required.
-        if self.consolidate_subcommand_args and self.has_required_args:
-            force_required_subparsers = True
+        if self.consolidate_subcommand_args:
+            if self.has_required_args:
+                force_required_subparsers = True
+            consolidated_specs = (self,) + consolidated_specs
 
-        # Create subparser tree.
-        subparser_group = None
+        # Create subparser tree. Depending on whether we want to consolidate
+        # subcommand args, we can either apply arguments to the intermediate parser
+        # or only on the leaves.
         if self.subparsers is not None:
-            leaves = self.subparsers.apply(parser, force_required_subparsers)
+            self.subparsers.apply(
+                parser, force_required_subparsers, consolidated_specs, lazy_subparsers
+            )
             subparser_group = parser._action_groups.pop()
-        else:
-            leaves = (parser,)
-
-        # Depending on whether we want to consolidate subcommand args, we can either
-        # apply arguments to the intermediate parser or only on the leaves.
-        if self.consolidate_subcommand_args:
-            for leaf in leaves:
-                self.apply_args(leaf)
-        else:
-            self.apply_args(parser)
-
-        if subparser_group is not None:
+            if not self.consolidate_subcommand_args:
+                self.apply_args(parser)
             parser._action_groups.append(subparser_group)
+        else:
+            if not self.consolidate_subcommand_args:
+                self.apply_args(parser)
+            for spec in consolidated_specs:
+                spec.apply_args(parser)
 
         # Break some API boundaries to rename the "optional arguments" => "options".
         assert parser._action_groups[1].title in (
@@ -242,8 +269,6 @@ class ParserSpecification:
         )
         parser._action_groups[1].title = "options"
 
-        return leaves
-
     def apply_args(
         self,
         parser: argparse.ArgumentParser,
@@ -412,6 +437,19 @@ def handle_field(
 class SubparsersSpecification:
     """Structure for defining subparsers. Each subparser is a parser with a name."""
 
+    # See `ParserSpecification.__slots__`.
+    __slots__ = (
+        "name",
+        "description",
+        "parser_from_name",
+        "default_name",
+        "default_parser",
+        "intern_prefix",
+        "required",
+        "default_instance",
+        "options",
+    )
+
     name: str
     description: str | None
     parser_from_name: Dict[str, ParserSpecification]
@@ -665,7 +703,9 @@ class SubparsersSpecification:
         self,
         parent_parser: argparse.ArgumentParser,
         force_required_subparsers: bool,
-    ) -> Tuple[argparse.ArgumentParser, ...]:
+        consolidated_specs: Tuple[ParserSpecification, ...],
+        lazy_subparsers: bool,
+    ) -> None:
         title = "subcommands"
         metavar = "{" + ",".join(self.parser_from_name.keys()) + "}"
 
@@ -700,35 +740,58 @@ class SubparsersSpecification:
             required=required,
             title=title,
             metavar=metavar,
+            **(
+                {"action": _argparse_formatter.TyroLazySubparsersAction}
+                if lazy_subparsers
+                else {}
+            ),
         )
 
-        subparser_tree_leaves: List[argparse.ArgumentParser] = []
         for name, subparser_def in self.parser_from_name.items():
             helptext = subparser_def.description.replace("%", "%%")
             if len(helptext) > 0:
                 # TODO: calling a private function here.
                 helptext = _arguments._rich_tag_if_enabled(helptext.strip(), "helptext")
 
-            subparser = argparse_subparsers.add_parser(
-                name,
-                formatter_class=_argparse_formatter.TyroArgparseHelpFormatter,
-                help=helptext,
-                allow_abbrev=False,
-            )
-
-            # Attributes used for error message generation.
-            assert isinstance(subparser, _argparse_formatter.TyroArgumentParser)
-            assert isinstance(parent_parser, _argparse_formatter.TyroArgumentParser)
-            subparser._parsing_known_args = parent_parser._parsing_known_args
-            subparser._parser_specification = parent_parser._parser_specification
-            subparser._console_outputs = parent_parser._console_outputs
-            subparser._args = parent_parser._args
-
-            subparser_tree_leaves.extend(
-                subparser_def.apply(subparser, force_required_subparsers)
-            )
+            def build_subparser(
+                subparser: argparse.ArgumentParser,
+                subparser_def: ParserSpecification = subparser_def,
+            ) -> None:
+                # Attributes used for error message generation.
+                assert isinstance(subparser, _argparse_formatter.TyroArgumentParser)
+                assert isinstance(parent_parser, _argparse_formatter.TyroArgumentParser)
+                subparser._parsing_known_args = parent_parser._parsing_known_args
+                subparser._parser_specification = parent_parser._parser_specification
+                subparser._console_outputs = parent_parser._console_outputs
+                subparser._args = parent_parser._args
+
+                subparser_def.apply(
+                    subparser,
+                    force_required_subparsers,
+                    consolidated_specs,
+                    lazy_subparsers,
+                )
 
-        return tuple(subparser_tree_leaves)
+            if lazy_subparsers:
+                assert isinstance(
+                    argparse_subparsers, _argparse_formatter.TyroLazySubparsersAction
+                )
+                argparse_subparsers.add_lazy_parser(
+                    name,
+                    build_subparser,
+                    formatter_class=_argparse_formatter.TyroArgparseHelpFormatter,
+                    help=helptext,
+                    allow_abbrev=False,
+                )
+            else:
+                build_subparser(
+                    argparse_subparsers.add_parser(
+                        name,
+                        formatter_class=_argparse_formatter.TyroArgparseHelpFormatter,
+                        help=helptext,
+                        allow_abbrev=False,
+                    )
+                )
 
 
 def add_subparsers_to_leaves(
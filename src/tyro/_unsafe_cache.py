@@ -1,8 +1,21 @@
 import functools
 import sys
-from typing import Any, Callable, Dict, List, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    KeysView,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 CallableType = TypeVar("CallableType", bound=Callable)
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
 
 
 _cache_list: List[Dict[Any, Any]] = []
@@ -60,3 +73,29 @@ def _make_key(obj: Any) -> Any:
     except TypeError:
         # If the object is not hashable, we'll use assume the type/id are unique...
         return type(obj), id(obj)
+
+
+class PersistentCache(Generic[KeyType, ValueType]):
+    """Bounded cache for values that are reused across `tyro.cli()` calls. Unlike
+    `unsafe_cache()`, this is never cleared; the oldest entry is evicted when the
+    cache is full.
+
+    Keys can contain `id()`s. Objects passed in via `keep_alive` are referenced for as
+    long as their entry is cached, which keeps these `id()`s valid.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: Dict[KeyType, Tuple[Any, ValueType]] = {}
+
+    def get(self, key: KeyType) -> Optional[ValueType]:
+        entry = self._entries.get(key, None)
+        return None if entry is None else entry[1]
+
+    def set(self, key: KeyType, value: ValueType, keep_alive: Any) -> None:
+        self._entries[key] = (keep_alive, value)
+        if len(self._entries) > self._maxsize:
+            self._entries.pop(next(iter(self._entries)))
+
+    def keys(self) -> KeysView[KeyType]:
+        return self._entries.keys()
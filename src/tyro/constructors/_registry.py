@@ -17,6 +17,7 @@ from ._struct_spec import (
     StructConstructorSpec,
     StructTypeInfo,
     apply_default_struct_rules,
+    mark_dynamic_default,
 )
 
 current_registry: ConstructorRegistry | None = None
@@ -186,6 +187,9 @@ class ConstructorRegistry:
                 for spec_factory in registry._struct_rules[::-1]:
                     maybe_spec = spec_factory(type_info)
                     if maybe_spec is not None:
+                        if registry is not cls._active_registries[0]:
+                            # We can't tell how custom rules compute defaults.
+                            mark_dynamic_default()
                         return maybe_spec
 
         return None
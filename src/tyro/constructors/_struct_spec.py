@@ -32,6 +32,22 @@ from ..conf import _confstruct, _markers
 if TYPE_CHECKING:
     from ._registry import ConstructorRegistry
 
+_dynamic_default_count: int = 0
+
+
+def mark_dynamic_default() -> None:
+    """Record that a default value was computed dynamically, for example by calling a
+    `default_factory`. These can change between calls, so parser specifications that
+    contain them shouldn't be reused."""
+    global _dynamic_default_count
+    _dynamic_default_count += 1
+
+
+def dynamic_default_count() -> int:
+    """Get the number of dynamically computed default values so far. Compare before
+    and after building a parser specification to check for dynamic defaults."""
+    return _dynamic_default_count
+
 
 @dataclasses.dataclass(frozen=True)
 class UnsupportedStructTypeMessage:
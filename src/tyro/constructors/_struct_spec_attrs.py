@@ -4,7 +4,12 @@ import sys
 
 from .. import _docstrings, _resolver
 from .._singleton import MISSING_AND_MISSING_NONPROP, MISSING_NONPROP
-from ._struct_spec import StructConstructorSpec, StructFieldSpec, StructTypeInfo
+from ._struct_spec import (
+    StructConstructorSpec,
+    StructFieldSpec,
+    StructTypeInfo,
+    mark_dynamic_default,
+)
 
 
 def attrs_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
@@ -45,6 +50,7 @@ def attrs_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
         elif default is attr.NOTHING:
             default = MISSING_NONPROP
         elif isinstance(default, attr.Factory):  # type: ignore
+            mark_dynamic_default()
             default = default.factory()  # type: ignore
 
         assert attr_field.type is not None, attr_field
@@ -6,7 +6,12 @@ from typing import Any, cast
 
 from .. import _docstrings, _resolver
 from .._singleton import MISSING, MISSING_AND_MISSING_NONPROP, MISSING_NONPROP
-from ._struct_spec import StructConstructorSpec, StructFieldSpec, StructTypeInfo
+from ._struct_spec import (
+    StructConstructorSpec,
+    StructFieldSpec,
+    StructTypeInfo,
+    mark_dynamic_default,
+)
 from ._struct_spec_flax import is_flax_module
 
 
@@ -64,6 +69,7 @@ def _get_dataclass_field_default(
         # before this method is called.
         dataclasses.is_dataclass(field.type) and field.default_factory is field.type
     ):
+        mark_dynamic_default()
         return field.default_factory()
 
     # Otherwise, no default.
@@ -6,7 +6,12 @@ from typing_extensions import get_type_hints
 
 from .._docstrings import get_field_docstring
 from .._singleton import MISSING, MISSING_NONPROP
-from ._struct_spec import StructConstructorSpec, StructFieldSpec, StructTypeInfo
+from ._struct_spec import (
+    StructConstructorSpec,
+    StructFieldSpec,
+    StructTypeInfo,
+    mark_dynamic_default,
+)
 
 
 def msgspec_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
@@ -39,6 +44,7 @@ def msgspec_rule(info: StructTypeInfo) -> StructConstructorSpec | None:
         elif field.default is not msgspec.NODEFAULT:
             default = field.default
         elif field.default_factory is not msgspec.NODEFAULT:
+            mark_dynamic_default()
             default = field.default_factory()
         else:
             default = MISSING_NONPROP
@@ -7,7 +7,12 @@ from typing_extensions import Annotated, cast
 
 from .. import _docstrings, _resolver
 from .._singleton import MISSING_AND_MISSING_NONPROP, MISSING_NONPROP
-from ._struct_spec import StructConstructorSpec, StructFieldSpec, StructTypeInfo
+from ._struct_spec import (
+    StructConstructorSpec,
+    StructFieldSpec,
+    StructTypeInfo,
+    mark_dynamic_default,
+)
 
 if TYPE_CHECKING:
     import pydantic as pydantic
@@ -31,6 +36,8 @@ def _get_pydantic_v1_field_default(
             return getattr(parent_default_instance, name)
 
     if not field.required:
+        if field.default_factory is not None:
+            mark_dynamic_default()
         return field.get_default()
 
     # Otherwise, no default.
@@ -54,6 +61,8 @@ def _get_pydantic_v2_field_default(
             return getattr(parent_default_instance, name)
 
     if not field.is_required():
+        if field.default_factory is not None:
+            mark_dynamic_default()
         return field.get_default(call_default_factory=True)
 
     # Otherwise, no default.
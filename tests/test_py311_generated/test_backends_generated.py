@@ -0,0 +1,186 @@
+"""Check that the tyro and argparse parsing backends produce the same outputs."""
+
+import dataclasses
+from typing import Annotated, Any, List, Literal, Tuple
+
+import pytest
+
+import tyro
+from tyro._backends import _tyro_backend
+
+
+def _cli_both_backends(f: Any, args: List[str], **kwargs: Any) -> Any:
+    """Run `tyro.cli()` with each backend, and check that outputs match."""
+    with pytest.MonkeyPatch.context() as m:
+        m.setenv("PYTHON_TYRO_BACKEND", "argparse")
+        out_argparse = tyro.cli(f, args=args, **kwargs)
+    with pytest.MonkeyPatch.context() as m:
+        m.setenv("PYTHON_TYRO_BACKEND", "tyro")
+        out_tyro = tyro.cli(f, args=args, **kwargs)
+    assert out_argparse == out_tyro
+    return out_tyro
+
+
+def test_flat() -> None:
+    @dataclasses.dataclass
+    class A:
+        x: int
+        y: Tuple[int, ...] = (1, 2)
+        mode: Literal["a", "b"] = "a"
+        flag: bool = False
+
+    assert _cli_both_backends(A, ["--x", "3"]) == A(3)
+    assert _cli_both_backends(
+        A, ["--x=3", "--y", "-1", "5", "--mode", "b", "--flag"]
+    ) == A(3, (-1, 5), "b", True)
+    assert _cli_both_backends(A, ["--flag", "--x", "3", "--no-flag"]) == A(3)
+
+
+def test_positional() -> None:
+    def main(
+        a: int, b: Tuple[str, ...], /, c: int = 3
+    ) -> Tuple[int, Tuple[str, ...], int]:
+        return a, b, c
+
+    assert _cli_both_backends(main, ["1", "x", "y"]) == (1, ("x", "y"), 3)
+    assert _cli_both_backends(main, ["1", "--c", "4"]) == (1, (), 4)
+    assert _cli_both_backends(main, ["--c", "4", "1", "x"]) == (1, ("x",), 4)
+
+
+def test_counter_and_append() -> None:
+    @dataclasses.dataclass
+    class A:
+        verbosity: tyro.conf.UseCounterAction[int]
+        tags: tyro.conf.UseAppendAction[List[str]] = dataclasses.field(
+            default_factory=list
+        )
+
+    assert _cli_both_backends(
+        A, ["--verbosity", "--tags", "a", "--verbosity", "--tags", "b"]
+    ) == A(2, ["a", "b"])
+
+
+@dataclasses.dataclass
+class Leaf:
+    x: int = 0
+
+
+@dataclasses.dataclass
+class Branch:
+    left: (
+        Annotated[Leaf, tyro.conf.subcommand("a")]
+        | Annotated[Leaf, tyro.conf.subcommand("b")]
+    )
+    right: (
+        Annotated[Leaf, tyro.conf.subcommand("c")]
+        | Annotated[Leaf, tyro.conf.subcommand("d")]
+    )
+    y: int = 1
+
+
+def test_subcommands() -> None:
+    assert _cli_both_backends(
+        Branch, ["--y", "2", "left:b", "--left.x", "3", "right:c"]
+    ) == Branch(Leaf(3), Leaf(0), 2)
+
+
+def test_subcommands_consolidated() -> None:
+    assert _cli_both_backends(
+        tyro.conf.ConsolidateSubcommandArgs[Branch],
+        ["left:a", "right:d", "--right.x", "3", "--y", "2"],
+    ) == Branch(Leaf(0), Leaf(3), 2)
+
+
+def test_unknown_args() -> None:
+    @dataclasses.dataclass
+    class A:
+        x: int = 0
+
+    assert _cli_both_backends(
+        A, ["--x", "1", "--unknown", "2"], return_unknown_args=True
+    ) == (A(1), ["--unknown", "2"])
+    assert _cli_both_backends(A, ["--x", "1"], return_unknown_args=True) == (
+        A(1),
+        [],
+    )
+
+
+def test_errors_deferred_to_argparse() -> None:
+    @dataclasses.dataclass
+    class A:
+        x: int
+        mode: Literal["a", "b"] = "a"
+
+    for args in (["--help"], [], ["--x"], ["--x", "1", "--mode", "c"]):
+        with pytest.raises(SystemExit):
+            tyro.cli(A, args=args)
+
+
+def test_flat_fast_path() -> None:
+    @dataclasses.dataclass
+    class A:
+        x: int = 0
+        name: str = "hello"
+        flag: bool = False
+
+    assert _cli_both_backends(A, ["--x", "-3", "--name", "- a"]) == A(-3, "- a")
+    assert _cli_both_backends(A, ["--flag", "--name=--x"]) == A(0, "--x", True)
+    for args in (["--x"], ["--x", "--flag"], ["--flag=True"], ["3"], ["--", "3"]):
+        with pytest.raises(SystemExit):
+            tyro.cli(A, args=args)
+
+
+def test_lazy_subparsers(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.MonkeyPatch.context() as m:
+        m.setenv("PYTHON_TYRO_BACKEND", "argparse")
+        with pytest.raises(SystemExit):
+            tyro.cli(
+                tyro.conf.ConsolidateSubcommandArgs[Branch],
+                args=["left:a", "right:d", "--help"],
+            )
+    helptext = capsys.readouterr().out
+    assert "--right.x" in helptext
+    assert "--y" in helptext
+
+    # Parsers returned by `tyro.extras.get_parser()` should be fully built.
+    parser = tyro.extras.get_parser(Branch)
+    subparsers = parser._subparsers._group_actions[0]  # type: ignore
+    assert all(p is not None for p in subparsers.choices.values())
+
+
+def test_parser_nodes_reused() -> None:
+    @dataclasses.dataclass(frozen=True)
+    class A:
+        tags: tyro.conf.UseAppendAction[Tuple[str, ...]] = ()
+
+    for _ in range(2):
+        assert _cli_both_backends(A, []) == A()
+        assert _cli_both_backends(A, ["--tags", "a", "--tags", "b"]) == A(("a", "b"))
+    for _ in range(2):
+        assert _cli_both_backends(
+            Branch, ["left:a", "--left.x", "3", "right:d"]
+        ) == Branch(Leaf(3), Leaf(0), 1)
+        assert _cli_both_backends(Branch, ["left:b", "right:d"]) == Branch(
+            Leaf(0), Leaf(0), 1
+        )
+
+
+def test_deferred_specs_not_rebuilt(monkeypatch: pytest.MonkeyPatch) -> None:
+    @dataclasses.dataclass(frozen=True)
+    class A:
+        # Negative number-like option strings are handled by argparse.
+        x: Annotated[int, tyro.conf.arg(aliases=("-1",))] = 0
+
+    built = []
+    build_root_node = _tyro_backend.build_root_node
+
+    def counting_build_root_node(parser_spec: Any) -> Any:
+        built.append(parser_spec)
+        return build_root_node(parser_spec)
+
+    monkeypatch.setattr(_tyro_backend, "build_root_node", counting_build_root_node)
+    monkeypatch.setenv("PYTHON_TYRO_BACKEND", "tyro")
+    for _ in range(3):
+        assert tyro.cli(A, args=["-1", "3"]) == A(3)
+    assert len(built) == 1
+    assert build_root_node(built[0]) is None
@@ -0,0 +1,196 @@
+"""Tests for caching parser specifications across `tyro.cli()` calls."""
+
+import dataclasses
+import itertools
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+import tyro
+from tyro import _cli
+
+
+def test_spec_reused() -> None:
+    @dataclasses.dataclass(frozen=True)
+    class A:
+        x: int
+        y: Tuple[int, ...] = (1, 2)
+
+    assert tyro.cli(A, args=["--x", "1"]) == A(1)
+    keys = [k for k in _cli._parser_spec_cache.keys() if k[0] == id(A)]
+    assert len(keys) == 1
+    entry = _cli._parser_spec_cache.get(keys[0])
+    assert tyro.cli(A, args=["--x", "2"]) == A(2)
+    assert [k for k in _cli._parser_spec_cache.keys() if k[0] == id(A)] == keys
+    assert _cli._parser_spec_cache.get(keys[0]) is entry
+
+
+def test_mutable_defaults_not_shared() -> None:
+    @dataclasses.dataclass
+    class A:
+        x: List[int] = dataclasses.field(default_factory=list)
+
+    out0 = tyro.cli(A, args=[])
+    out1 = tyro.cli(A, args=[])
+    assert out0 == out1 == A([])
+    assert out0.x is not out1.x
+    assert not any(k[0] == id(A) for k in _cli._parser_spec_cache.keys())
+
+
+def test_identity_hashed_defaults_not_shared() -> None:
+    class Box:
+        def __init__(self) -> None:
+            self.items: List[int] = []
+
+        def __hash__(self) -> int:
+            return id(self)
+
+    @dataclasses.dataclass(frozen=True)
+    class A:
+        b: tyro.conf.Suppress[Box] = dataclasses.field(default_factory=Box)
+
+    out0 = tyro.cli(A, args=[])
+    out0.b.items.append(1)
+    out1 = tyro.cli(A, args=[])
+    assert out0.b is not out1.b
+    assert out1.b.items == []
+
+
+def test_default_factory_reevaluated() -> None:
+    counter = itertools.count()
+
+    @dataclasses.dataclass(frozen=True)
+    class A:
+        run_id: int = dataclasses.field(default_factory=lambda: next(counter))
+
+    outs = [tyro.cli(A, args=[]) for _ in range(3)]
+    assert len(set(out.run_id for out in outs)) == 3
+    assert not any(k[0] == id(A) for k in _cli._parser_spec_cache.keys())
+
+
+def test_default_instance_identity() -> None:
+    # `1 == True`, but these shouldn't share a cached specification.
+    assert tyro.cli(int, default=1, args=[]) == 1
+    out = tyro.cli(int, default=True, args=[])
+    assert out is True
+
+
+def test_use_underscores() -> None:
+    @dataclasses.dataclass(frozen=True)
+    class A:
+        some_field: int = 0
+
+    assert tyro.cli(A, args=["--some-field", "3"]) == A(3)
+    assert tyro.cli(A, args=["--some_field", "3"], use_underscores=True) == A(3)
+    assert tyro.cli(A, args=["--some-field", "3"]) == A(3)
+
+
+def test_call_plan_nested(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Parser nodes are only built by the tyro backend.
+    monkeypatch.setenv("PYTHON_TYRO_BACKEND", "tyro")
+
+    @dataclasses.dataclass(frozen=True)
+    class Inner:
+        some_field: int = 0
+
+    @dataclasses.dataclass(frozen=True)
+    class Outer:
+        inner_a: Inner = Inner()
+        inner_b: Inner = Inner()
+
+    for _ in range(2):
+        assert tyro.cli(
+            Outer, args=["--inner-a.some-field", "1", "--inner-b.some-field", "2"]
+        ) == Outer(Inner(1), Inner(2))
+        assert tyro.cli(
+            Outer,
+            args=["--inner_b.some_field", "3"],
+            use_underscores=True,
+        ) == Outer(Inner(0), Inner(3))
+
+    # Call plans and parser nodes are stored with the cached specification.
+    keys = [k for k in _cli._parser_spec_cache.keys() if k[0] == id(Outer)]
+    (key,) = [k for k in keys if k[3] == "-"]
+    entry = _cli._parser_spec_cache.get(key)
+    assert entry is not None
+    assert len(entry.call_plans) == 3
+    assert entry.root_node is not None
+
+
+def test_union_order() -> None:
+    # `str| int == int| str`, but union members are tried in order.
+    assert tyro.cli(str | int, args=["5"]) == "5"
+    assert tyro.cli(int | str, args=["5"]) == 5
+    assert tyro.cli(str | int, args=["5"]) == "5"
+
+
+def test_dummy_wrapper_reused() -> None:
+    assert tyro.cli(Tuple[int, int], args=["1", "2"]) == (1, 2)
+    wrapper = _cli._dummy_wrapper_cache.get(id(Tuple[int, int]))
+    assert any(k[0] == id(wrapper) for k in _cli._parser_spec_cache.keys())
+    assert tyro.cli(Tuple[int, int], args=["3", "4"]) == (3, 4)
+    assert _cli._dummy_wrapper_cache.get(id(Tuple[int, int])) is wrapper
+
+
+def test_dummy_wrapper_default_reused() -> None:
+    # A new wrapper instance is created for each call, but the specification should
+    # still be reused.
+    default = (5, 6)
+    assert tyro.cli(Tuple[int, int], default=default, args=[]) == (5, 6)
+    wrapper = _cli._dummy_wrapper_cache.get(id(Tuple[int, int]))
+    keys = [k for k in _cli._parser_spec_cache.keys() if k[0] == id(wrapper)]
+    assert tyro.cli(Tuple[int, int], default=default, args=["1", "2"]) == (1, 2)
+    assert tyro.cli(Tuple[int, int], default=default, args=[]) == (5, 6)
+    assert [k for k in _cli._parser_spec_cache.keys() if k[0] == id(wrapper)] == keys
+
+
+def test_is_struct_type_registry() -> None:
+    assert tyro.cli(int, args=["1"]) == 1
+
+    # Registering a struct rule for `int` should invalidate cached results.
+    registry = tyro.constructors.ConstructorRegistry()
+
+    @registry.struct_rule
+    def _(
+        type_info: tyro.constructors.StructTypeInfo,
+    ) -> Optional[tyro.constructors.StructConstructorSpec]:
+        if type_info.type is not int:
+            return None
+        return tyro.constructors.StructConstructorSpec(
+            instantiate=lambda value: value,
+            fields=(
+                tyro.constructors.StructFieldSpec(
+                    name="value", type=str, default="0", helptext=None
+                ),
+            ),
+        )
+
+    with registry:
+        assert tyro.cli(int, args=["--value", "3"]) == "3"
+    assert tyro.cli(int, args=["2"]) == 2
+
+
+def test_warnings_not_cached() -> None:
+    @dataclasses.dataclass(frozen=True)
+    class A:
+        x: Dict[str, int] | int = None  # type: ignore
+
+    for _ in range(2):
+        with pytest.warns(UserWarning):
+            assert tyro.cli(A, args=[]).x is None
+
+
+def test_warnings_shown_every_call() -> None:
+    @dataclasses.dataclass(frozen=True)
+    class A:
+        x: Dict[str, int] | int = None  # type: ignore
+
+    # Under pytest, `_unsafe_cache` randomly recomputes cached values, which can
+    # show the same warning more than once per call.
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        for _ in range(3):
+            num_caught = len(caught)
+            assert tyro.cli(A, args=[]).x is None
+            assert len(caught) > num_caught